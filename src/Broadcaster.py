@@ -0,0 +1,231 @@
+import queue
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+# Default number of seconds between ticks of a started broadcaster
+TICK_INTERVAL: float = 0.1
+
+# Queued to wake a spectator blocked in Subscription.get when it is closed
+_CLOSED: Mapping[str, Any] = MappingProxyType({})
+
+class Subscription:
+    """
+    A spectator's view of a Broadcaster.
+
+    Each subscription owns a bounded queue of coalesced updates. A subscription
+    whose queue fills up is considered too slow and is dropped by the
+    broadcaster instead of blocking the game. Once a subscription is closed,
+    `get` returns the updates still queued and then None without waiting.
+
+    Attributes:
+        updates (queue.Queue): Bounded queue of pending updates, each mapping a
+            topic (e.g., "score", "round") to its latest payload
+        dropped (bool): True once the broadcaster has dropped this subscription
+        closed (bool): True once the subscription was dropped or unsubscribed
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        """
+        Initialize a subscription with a bounded update queue.
+
+        Args:
+            max_pending: Maximum number of undelivered updates before the
+                subscription is dropped
+        """
+        self.updates: "queue.Queue[Mapping[str, Any]]" = queue.Queue(maxsize=max_pending)
+        self.dropped: bool = False
+        self.closed: bool = False
+
+    def close(self) -> None:
+        """
+        Stop the subscription and wake a spectator waiting for an update.
+        """
+        self.closed = True
+        try:
+            self.updates.put_nowait(_CLOSED)
+        except queue.Full:
+            # A full queue means nobody is waiting on it
+            pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Mapping[str, Any]]:
+        """
+        Wait for the next update.
+
+        Args:
+            timeout: Optional number of seconds to wait
+
+        Returns:
+            The next update, or None if none arrived before the timeout or
+            the subscription is closed and drained
+        """
+        try:
+            if self.closed:
+                update = self.updates.get_nowait()
+            else:
+                update = self.updates.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return None if update is _CLOSED else update
+
+class Broadcaster:
+    """
+    Publish/subscribe hub that fans out live game events to spectators.
+
+    Publishing only records the latest payload for a topic, so it costs the
+    same however many spectators are attached. Pending payloads are delivered
+    to every subscriber once per tick, which coalesces all the updates made
+    since the previous tick into a single message. Updates, and any dictionary
+    payloads in them, are delivered read-only because every subscriber receives
+    the same objects. The subscriber list is replaced rather than mutated, so a
+    tick can fan out without holding the lock.
+
+    Once started, the broadcaster ticks on its own thread, so the fan-out never
+    runs on the publisher's thread.
+
+    Attributes:
+        max_pending (int): Default queue bound for new subscriptions
+    """
+
+    def __init__(self, max_pending: int = 16) -> None:
+        """
+        Initialize an empty broadcaster.
+
+        Args:
+            max_pending: Default queue bound for new subscriptions
+
+        Raises:
+            ValueError: If max_pending is less than 1
+        """
+        if max_pending < 1:
+            raise ValueError('max_pending must be at least 1')
+        self.max_pending: int = max_pending
+        self._subscribers: List[Subscription] = []
+        self._pending: Dict[str, Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._ticker: Optional[threading.Thread] = None
+        self._stopped: threading.Event = threading.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        """
+        Get the number of attached subscribers.
+
+        Returns:
+            Number of subscribers that have not been dropped or unsubscribed
+        """
+        return len(self._subscribers)
+
+    def subscribe(self, max_pending: Optional[int] = None) -> Subscription:
+        """
+        Attach a new spectator.
+
+        Args:
+            max_pending: Optional queue bound overriding the default
+
+        Returns:
+            The new subscription
+
+        Raises:
+            ValueError: If max_pending is less than 1
+        """
+        if max_pending is None:
+            max_pending = self.max_pending
+        elif max_pending < 1:
+            raise ValueError('max_pending must be at least 1')
+        subscription = Subscription(max_pending)
+        with self._lock:
+            self._subscribers = self._subscribers + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Detach a spectator.
+
+        Args:
+            subscription: The subscription to remove
+        """
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscription]
+        subscription.close()
+
+    def publish(self, topic: str, payload: Any) -> None:
+        """
+        Record the latest payload for a topic, replacing any undelivered one.
+
+        Args:
+            topic: The event topic (e.g., "score", "round")
+            payload: The latest state for the topic
+        """
+        with self._lock:
+            self._pending[topic] = payload
+
+    def start(self, interval: float = TICK_INTERVAL) -> None:
+        """
+        Start ticking on a background thread.
+
+        Args:
+            interval: Number of seconds between ticks
+        """
+        if self._ticker is not None:
+            return
+        self._stopped.clear()
+        self._ticker = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._ticker.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and deliver any pending payloads.
+        """
+        if self._ticker is None:
+            return
+        self._stopped.set()
+        self._ticker.join()
+        self._ticker = None
+        self.tick()
+
+    def _run(self, interval: float) -> None:
+        """
+        Tick every `interval` seconds until stopped.
+
+        Args:
+            interval: Number of seconds between ticks
+        """
+        while not self._stopped.wait(interval):
+            self.tick()
+
+    def tick(self) -> int:
+        """
+        Deliver all pending payloads to every subscriber as one update.
+
+        Subscribers whose queue is full are dropped.
+
+        Returns:
+            Number of subscribers the update was delivered to
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            subscribers = self._subscribers
+
+        update: Mapping[str, Any] = MappingProxyType({
+            topic: MappingProxyType(payload) if isinstance(payload, dict) else payload
+            for topic, payload in pending.items()
+        })
+
+        delivered: int = 0
+        slow: List[Subscription] = []
+        for subscription in subscribers:
+            try:
+                subscription.updates.put_nowait(update)
+                delivered += 1
+            except queue.Full:
+                subscription.dropped = True
+                subscription.close()
+                slow.append(subscription)
+
+        if slow:
+            with self._lock:
+                self._subscribers = [s for s in self._subscribers if not s.dropped]
+        return delivered
@@ -1,10 +1,12 @@
 import cmd
 import random
 import time
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional
 from Scoreboard import Scoreboard
 from Schema import Schema
 from Rule import Rule
+from Recording import RecordingWriter
 from utils import clear_screen
 
 # Define the game schema configuration
@@ -31,6 +33,22 @@ schema_config: Dict[str, List[Dict[str, str]]] = {
     ]
 }
 
+# Maximum number of (player choice, computer choice) outcomes kept in the resolution cache
+RESOLUTION_CACHE_SIZE: int = 4096
+
+class Outcome(NamedTuple):
+    """
+    The resolved result of a player choice against a computer choice.
+    
+    Attributes:
+        winner (str): 'player', 'computer' or 'tie'
+        reason (str): Why the winning choice won, empty for a tie
+        message (str): Rendered outcome message, as printed after the matchup
+    """
+    winner: str
+    reason: str
+    message: str
+
 class Game(cmd.Cmd):
     """
     Command-line interface and game logic for Rock-Paper-Scissors-Lizard-Spock.
@@ -45,17 +63,20 @@ class Game(cmd.Cmd):
         rules (Dict[str, Rule]): Dictionary of Rule objects
         valid_choices (List[str]): List of valid player choices
         scoreboard (Scoreboard): Tracks game scores
+        recorder (Optional[RecordingWriter]): Records every round when a
+            recording directory is given
     """
     
     intro: str = "Welcome to Rock, Paper, Scissors, Lizard, Spock!\n\nType 'start' to play the game or 'help' to list the commands.\n"
     prompt: str = '>>> '
 
-    def __init__(self, arg: Optional[str] = None) -> None:
+    def __init__(self, arg: Optional[str] = None, recording_dir: Optional[str] = None) -> None:
         """
         Initialize the game with schema, rules, and scoreboard.
         
         Args:
             arg: Optional argument (not used but required by cmd.Cmd)
+            recording_dir: Optional directory to record the session's rounds to
         """
         super().__init__()
         
@@ -63,6 +84,9 @@ class Game(cmd.Cmd):
         self.rules: Dict[str, Rule] = self.schema.rules
         self.valid_choices: List[str] = self.schema.rule_names
         self.scoreboard: Scoreboard = Scoreboard(['player', 'computer'])
+        self.choice_ids: Dict[str, int] = {choice: i for i, choice in enumerate(self.valid_choices)}
+        self.resolve: Callable[[str, str], Outcome] = lru_cache(maxsize=RESOLUTION_CACHE_SIZE)(self._resolve)
+        self.recorder: Optional[RecordingWriter] = RecordingWriter(recording_dir, self.valid_choices) if recording_dir else None
         
 #**************************CMD COMMANDS***********************************
     def do_start(self, arg: Optional[str] = None) -> None:
@@ -99,6 +123,8 @@ class Game(cmd.Cmd):
         Resets all scores to zero.
         """
         self.scoreboard.reset()
+        if self.recorder:
+            self.recorder.reset()
         print("Scores have been reset.")
     
     def do_quit(self, arg: Optional[str] = None) -> bool:
@@ -109,6 +135,23 @@ class Game(cmd.Cmd):
         return True
 
 #**************************FUNCTIONS**************************************
+    def preloop(self) -> None:
+        """
+        Start broadcasting to spectators when the command loop starts.
+        """
+        self.scoreboard.broadcaster.start()
+    
+    def close(self) -> None:
+        """
+        Release the game's resources.
+        
+        Stops the spectator broadcast, delivering any pending updates,
+        and writes out and closes the recording.
+        """
+        self.scoreboard.broadcaster.stop()
+        if self.recorder:
+            self.recorder.close()
+    
     def play_game(self) -> None:
         """
         Main game loop handling the gameplay flow.
@@ -122,6 +165,8 @@ class Game(cmd.Cmd):
             player_choice: str = self._get_player_choice()
         
             if player_choice == 'quit':
+                if self.recorder:
+                    self.recorder.flush()
                 clear_screen()
                 print("\nType 'start' to play the game or 'help' to list the commands.\n")
                 return
@@ -137,6 +182,8 @@ class Game(cmd.Cmd):
         - Getting the computer's choice
         - Displaying the matchup
         - Determining the winner
+        - Broadcasting the round to spectators
+        - Recording the round
         - Showing the updated score
         
         Args:
@@ -148,33 +195,65 @@ class Game(cmd.Cmd):
         computer_choice: str = random.choice(self.valid_choices)
         self._display_matchup(player_choice, computer_choice)
 
-        self._determine_winner(player_choice, computer_choice)
+        winner: str = self._determine_winner(player_choice, computer_choice)
+        self.scoreboard.broadcaster.publish('round', {
+            'player_choice': player_choice,
+            'computer_choice': computer_choice,
+            'winner': winner,
+        })
+        if self.recorder:
+            self.recorder.record(self.choice_ids[player_choice], self.choice_ids[computer_choice], winner)
 
         print(f"\n{self.scoreboard.display_scores()}")
         print("\nPress Enter to continue...")
         input()
         clear_screen()
     
-    def _determine_winner(self, player_choice: str, computer_choice: str) -> None:
+    def _determine_winner(self, player_choice: str, computer_choice: str) -> str:
         """
         Determine the winner and update the scoreboard.
         
-        This method compares the player's and computer's choices,
-        determines the winner, and updates the scoreboard accordingly.
+        This method looks up the resolved outcome of the choices,
+        prints it, and updates the scoreboard accordingly.
         
         Args:
             player_choice: The player's choice
             computer_choice: The computer's choice
+            
+        Returns:
+            'player' or 'computer' for the winner, or 'tie'
         """
-        if player_choice == computer_choice:
-            print("\nIt's a tie!")
+        outcome: Outcome = self.resolve(player_choice, computer_choice)
+        print(outcome.message)
+        if outcome.winner == 'tie':
             self.scoreboard.add_tie()
-        elif self.rules[player_choice].beats(computer_choice):
-            print(f"\nYou WON! because {player_choice} {self.rules[player_choice].win_reason(computer_choice)}")
-            self.scoreboard.add_win('player')
         else:
-            print(f"\nComputer WON! because {computer_choice} {self.rules[computer_choice].win_reason(player_choice)}")
-            self.scoreboard.add_win('computer')
+            self.scoreboard.add_win(outcome.winner)
+        return outcome.winner
+    
+    def _resolve(self, player_choice: str, computer_choice: str) -> Outcome:
+        """
+        Resolve a player choice against a computer choice.
+        
+        This method is wrapped in an LRU cache as `resolve`, so each pair
+        of choices is compared and rendered only once.
+        
+        Args:
+            player_choice: The player's choice
+            computer_choice: The computer's choice
+            
+        Returns:
+            The outcome of the round
+        """
+        if player_choice == computer_choice:
+            return Outcome('tie', '', "\nIt's a tie!")
+        
+        if self.rules[player_choice].beats(computer_choice):
+            reason: str = self.rules[player_choice].win_reason(computer_choice)
+            return Outcome('player', reason, f"\nYou WON! because {player_choice} {reason}")
+        
+        reason = self.rules[computer_choice].win_reason(player_choice)
+        return Outcome('computer', reason, f"\nComputer WON! because {computer_choice} {reason}")
 
     def _display_matchup(self, player_choice: str, computer_choice: str) -> None:
         """
@@ -0,0 +1,389 @@
+import os
+import struct
+import time
+from bisect import bisect_right
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple
+from Scoreboard import Scoreboard
+
+# Outcome IDs stored in each record, in the order their counters are checkpointed
+OUTCOMES: Tuple[str, ...] = ('tie', 'player', 'computer')
+
+MAGIC: bytes = b'RPSR'
+VERSION: int = 1
+
+# Segment header: magic, version, index of the first round, start time in ms since the epoch
+HEADER = struct.Struct('<4sBQQ')
+# Round record: player choice ID, computer choice ID, outcome ID, ms since segment start
+RECORD = struct.Struct('<BBBI')
+# Checkpoint: round index followed by the outcome counters before that round.
+# A reset adds a checkpoint with zeroed counters, after any other one for the same round
+CHECKPOINT = struct.Struct('<Q' + 'Q' * len(OUTCOMES))
+
+SEGMENT_ROUNDS: int = 1 << 20
+CHECKPOINT_INTERVAL: int = 4096
+MAX_OFFSET_MS: int = 0xFFFFFFFF
+MAX_CHOICE_ID: int = 0xFF
+
+# Choice names, one per line in choice ID order
+CHOICES_FILE: str = 'choices.txt'
+SEGMENT_SUFFIX: str = '.seg'
+INDEX_SUFFIX: str = '.idx'
+
+class RecordedRound(NamedTuple):
+    """
+    A single round read back from a recording.
+
+    Attributes:
+        position (int): Zero-based position of the round in the recording
+        player_choice (int): ID of the player's choice
+        computer_choice (int): ID of the computer's choice
+        winner (str): 'player', 'computer' or 'tie'
+        timestamp (float): Time the round was played, in seconds since the epoch
+    """
+    position: int
+    player_choice: int
+    computer_choice: int
+    winner: str
+    timestamp: float
+
+class RecordingWriter:
+    """
+    Appends played rounds to a segmented binary recording.
+
+    A recording is a directory of numbered segments, along with the names of
+    the choices its IDs refer to. Each segment file holds a header followed by
+    fixed-size round records, and has a companion index file with a scoreboard
+    checkpoint every CHECKPOINT_INTERVAL rounds and after every reset. Records
+    are buffered and written in batches.
+
+    Attributes:
+        directory (str): Directory holding the recording
+        choices (List[str]): Choice names, indexed by choice ID
+        batch_size (int): Number of rounds buffered before they are written
+        rounds (int): Total number of rounds in the recording
+        counts (List[int]): Outcome counters, in OUTCOMES order
+    """
+
+    def __init__(self, directory: str, choices: List[str], batch_size: int = 1024) -> None:
+        """
+        Open a recording for appending, creating it if needed.
+
+        An existing recording is continued in a new segment, starting from
+        an empty scoreboard like the new session it records.
+
+        Args:
+            directory: Directory holding the recording
+            choices: Choice names, indexed by choice ID
+            batch_size: Number of rounds buffered before they are written
+
+        Raises:
+            ValueError: If there are too many choices for a record, or the
+                recording holds rounds of different choices
+        """
+        if len(choices) > MAX_CHOICE_ID + 1:
+            raise ValueError(f'A recording holds at most {MAX_CHOICE_ID + 1} choices')
+        self.directory: str = directory
+        self.choices: List[str] = list(choices)
+        self.batch_size: int = batch_size
+        os.makedirs(directory, exist_ok=True)
+
+        reader = RecordingReader(directory)
+        if len(reader) and reader.choices != self.choices:
+            raise ValueError(f'{directory} was recorded with different choices')
+        with open(os.path.join(directory, CHOICES_FILE), 'w', encoding='utf-8') as choices_file:
+            choices_file.write(''.join(f'{choice}\n' for choice in self.choices))
+        self.rounds: int = len(reader)
+        self.counts: List[int] = [0] * len(OUTCOMES)
+        self._next_segment: int = reader.segment_count
+
+        self._segment_start_ms: int = 0
+        self._segment_rounds: int = 0
+        self._records: bytearray = bytearray()
+        self._checkpoints: bytearray = bytearray()
+        self._segment_file: Optional[BinaryIO] = None
+        self._index_file: Optional[BinaryIO] = None
+
+    def record(self, player_choice: int, computer_choice: int, winner: str,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Append a round to the recording.
+
+        Args:
+            player_choice: ID of the player's choice
+            computer_choice: ID of the computer's choice
+            winner: 'player', 'computer' or 'tie'
+            timestamp: Optional time of the round in seconds since the epoch,
+                defaults to now
+
+        Raises:
+            ValueError: If the winner is not a known outcome or a choice ID
+                does not fit in a record
+        """
+        if winner not in OUTCOMES:
+            raise ValueError(f'Unknown outcome: {winner}')
+        for choice in (player_choice, computer_choice):
+            if not 0 <= choice <= MAX_CHOICE_ID:
+                raise ValueError(f'Choice ID {choice} is outside 0-{MAX_CHOICE_ID}')
+        timestamp_ms: int = int((time.time() if timestamp is None else timestamp) * 1000)
+
+        if (self._segment_file is None or self._segment_rounds >= SEGMENT_ROUNDS
+                or not 0 <= timestamp_ms - self._segment_start_ms <= MAX_OFFSET_MS):
+            self._start_segment(timestamp_ms)
+
+        if self._segment_rounds == 0 or self.rounds % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints += CHECKPOINT.pack(self.rounds, *self.counts)
+
+        outcome: int = OUTCOMES.index(winner)
+        self._records += RECORD.pack(player_choice, computer_choice, outcome,
+                                     timestamp_ms - self._segment_start_ms)
+        self.counts[outcome] += 1
+        self.rounds += 1
+        self._segment_rounds += 1
+
+        if len(self._records) >= self.batch_size * RECORD.size:
+            self.flush()
+
+    def reset(self) -> None:
+        """
+        Record that the scoreboard was reset before the next round.
+        """
+        self.counts = [0] * len(OUTCOMES)
+        # Without an open segment, the next segment's first checkpoint records the reset
+        if self._segment_file is not None:
+            self._checkpoints += CHECKPOINT.pack(self.rounds, *self.counts)
+
+    def flush(self) -> None:
+        """
+        Write all buffered rounds and checkpoints to disk.
+        """
+        if self._segment_file is None or self._index_file is None:
+            return
+        # Checkpoints go first: one past the end of the records is never used,
+        # while records without their segment's first checkpoint could not be replayed
+        self._index_file.write(self._checkpoints)
+        self._index_file.flush()
+        self._segment_file.write(self._records)
+        self._segment_file.flush()
+        self._records.clear()
+        self._checkpoints.clear()
+
+    def close(self) -> None:
+        """
+        Flush buffered rounds and close the current segment.
+        """
+        self.flush()
+        if self._segment_file is not None and self._index_file is not None:
+            self._segment_file.close()
+            self._index_file.close()
+            self._segment_file = None
+            self._index_file = None
+
+    def _start_segment(self, timestamp_ms: int) -> None:
+        """
+        Close the current segment and open the next one.
+
+        Args:
+            timestamp_ms: Start time of the new segment in ms since the epoch
+        """
+        self.close()
+        path: str = os.path.join(self.directory, f'{self._next_segment:06d}')
+        segment_file: BinaryIO = open(path + SEGMENT_SUFFIX, 'wb')
+        segment_file.write(HEADER.pack(MAGIC, VERSION, self.rounds, timestamp_ms))
+        self._segment_file = segment_file
+        self._index_file = open(path + INDEX_SUFFIX, 'wb')
+        self._segment_start_ms = timestamp_ms
+        self._segment_rounds = 0
+        self._next_segment += 1
+
+class RecordingReader:
+    """
+    Random access to the rounds of a recording.
+
+    Rounds are located by binary search over segment start rounds and then by
+    offset within the fixed-size records, so any round is read without
+    scanning the rounds before it. Scoreboard states are rebuilt from the
+    nearest checkpoint, so resets and new sessions are reflected in them.
+
+    Attributes:
+        directory (str): Directory holding the recording
+        choices (List[str]): Choice names, indexed by choice ID
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Open a recording for reading.
+
+        Args:
+            directory: Directory holding the recording
+
+        Raises:
+            ValueError: If a segment file is not a recording segment
+        """
+        self.directory: str = directory
+        self.choices: List[str] = []
+        choices_path: str = os.path.join(directory, CHOICES_FILE)
+        if os.path.exists(choices_path):
+            with open(choices_path, encoding='utf-8') as choices_file:
+                self.choices = choices_file.read().splitlines()
+        self._paths: List[str] = []
+        self._starts: List[int] = []
+        self._start_ms: List[int] = []
+        self._total: int = 0
+
+        names: List[str] = sorted(name for name in os.listdir(directory)
+                                  if name.endswith(SEGMENT_SUFFIX)) if os.path.isdir(directory) else []
+        for name in names:
+            path: str = os.path.join(directory, name[:-len(SEGMENT_SUFFIX)])
+            with open(path + SEGMENT_SUFFIX, 'rb') as segment:
+                header: bytes = segment.read(HEADER.size)
+            if len(header) < HEADER.size:
+                continue
+            magic, version, start, start_ms = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f'Not a recording segment: {path + SEGMENT_SUFFIX}')
+            rounds: int = (os.path.getsize(path + SEGMENT_SUFFIX) - HEADER.size) // RECORD.size
+            self._paths.append(path)
+            self._starts.append(start)
+            self._start_ms.append(start_ms)
+            self._total = start + rounds
+
+    def __len__(self) -> int:
+        """
+        Get the number of rounds in the recording.
+
+        Returns:
+            Total number of complete rounds
+        """
+        return self._total
+
+    @property
+    def segment_count(self) -> int:
+        """
+        Get the number of segments in the recording.
+
+        Returns:
+            Number of segment files
+        """
+        return len(self._paths)
+
+    def round_at(self, index: int) -> RecordedRound:
+        """
+        Read a single round.
+
+        Args:
+            index: Zero-based position of the round
+
+        Returns:
+            The recorded round
+
+        Raises:
+            IndexError: If the recording has no round at this index
+        """
+        return next(self.rounds(index, index + 1))
+
+    def rounds(self, start: int = 0, stop: Optional[int] = None) -> Iterator[RecordedRound]:
+        """
+        Iterate over a range of rounds.
+
+        Args:
+            start: Position of the first round
+            stop: Optional position after the last round, defaults to the end
+
+        Yields:
+            The recorded rounds in order
+
+        Raises:
+            IndexError: If start is outside the recording
+        """
+        stop = self._total if stop is None else min(stop, self._total)
+        if not 0 <= start < self._total:
+            raise IndexError(f'Round {start} is out of range')
+
+        segment: int = self._segment_of(start)
+        index: int = start
+        while index < stop:
+            segment_stop: int = self._starts[segment + 1] if segment + 1 < len(self._starts) else self._total
+            count: int = min(stop, segment_stop) - index
+            with open(self._paths[segment] + SEGMENT_SUFFIX, 'rb') as segment_file:
+                segment_file.seek(HEADER.size + (index - self._starts[segment]) * RECORD.size)
+                data: bytes = segment_file.read(count * RECORD.size)
+            for player_choice, computer_choice, outcome, offset_ms in RECORD.iter_unpack(data):
+                timestamp: float = (self._start_ms[segment] + offset_ms) / 1000
+                yield RecordedRound(index, player_choice, computer_choice, OUTCOMES[outcome], timestamp)
+                index += 1
+            segment += 1
+
+    def counts_at(self, index: int) -> List[int]:
+        """
+        Get the outcome counters after the first `index` rounds, including any
+        reset made before the next round.
+
+        Args:
+            index: Number of rounds to replay
+
+        Returns:
+            Outcome counters, in OUTCOMES order
+
+        Raises:
+            IndexError: If index is outside the recording
+        """
+        if not 0 <= index <= self._total:
+            raise IndexError(f'Round {index} is out of range')
+        if index == 0:
+            return [0] * len(OUTCOMES)
+
+        # The segment holding the next round has its checkpoints, unless the recording ends here
+        segment: int = self._segment_of(min(index, self._total - 1))
+        checkpoint_round, counts = self._checkpoint_before(segment, index)
+        if checkpoint_round < index:
+            for recorded in self.rounds(checkpoint_round, index):
+                counts[OUTCOMES.index(recorded.winner)] += 1
+        return counts
+
+    def scoreboard_at(self, index: int) -> Scoreboard:
+        """
+        Rebuild the scoreboard after the first `index` rounds.
+
+        Args:
+            index: Number of rounds to replay
+
+        Returns:
+            A scoreboard holding the state after those rounds
+        """
+        counts: List[int] = self.counts_at(index)
+        scoreboard = Scoreboard([outcome for outcome in OUTCOMES if outcome != 'tie'])
+        for outcome, count in zip(OUTCOMES, counts):
+            if outcome == 'tie':
+                scoreboard.ties = count
+            else:
+                scoreboard.set_score(outcome, count)
+        return scoreboard
+
+    def _segment_of(self, index: int) -> int:
+        """
+        Find the segment holding a round.
+
+        Args:
+            index: Position of the round
+
+        Returns:
+            Position of the segment in the recording
+        """
+        return bisect_right(self._starts, index) - 1
+
+    def _checkpoint_before(self, segment: int, index: int) -> Tuple[int, List[int]]:
+        """
+        Find the latest checkpoint of a segment at or before a round.
+
+        Args:
+            segment: Position of the segment in the recording
+            index: Position of the round
+
+        Returns:
+            The checkpoint's round and its outcome counters
+        """
+        with open(self._paths[segment] + INDEX_SUFFIX, 'rb') as index_file:
+            data: bytes = index_file.read()
+        checkpoints = list(CHECKPOINT.iter_unpack(data[:len(data) - len(data) % CHECKPOINT.size]))
+        position: int = bisect_right([checkpoint[0] for checkpoint in checkpoints], index) - 1
+        return checkpoints[position][0], list(checkpoints[position][1:])
@@ -63,9 +63,7 @@ class Rule:
         Returns:
             The winning reason if this rule beats the opponent, empty string otherwise
         """
-        if self.beats(opponent):
-            return self.wins_against[opponent]
-        return ""
+        return self.wins_against.get(opponent, "")
     
     def __str__(self) -> str:
         """
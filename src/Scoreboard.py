@@ -1,15 +1,21 @@
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from Broadcaster import Broadcaster
 
 class Scoreboard:
     """
     Tracks scores for all players in the game and the number of ties.
     
     The scoreboard maintains a dictionary of scores for each player and
-    provides methods to update and display the scores.
+    provides methods to update and display the scores. Every change is
+    published on the "score" topic of its broadcaster for spectators. The
+    rendered scores are cached until a counter changes, which is why `scores`
+    is read-only and counts are set with `set_score` and the `ties` setter.
     
     Attributes:
-        scores (Dict[str, int]): Dictionary mapping player identifiers to their scores
+        scores (Mapping[str, int]): Read-only view mapping player identifiers to their scores
         ties (int): Number of tie games
+        broadcaster (Broadcaster): Publishes score updates to spectators
     """
     
     def __init__(self, players: List[str]) -> None:
@@ -19,8 +25,53 @@ class Scoreboard:
         Args:
             players: List of player identifiers
         """
-        self.scores: Dict[str, int] = {player: 0 for player in players}
-        self.ties: int = 0
+        self._scores: Dict[str, int] = {player: 0 for player in players}
+        self._ties: int = 0
+        self.broadcaster: Broadcaster = Broadcaster()
+        self._display: Optional[str] = None
+    
+    @property
+    def scores(self) -> Mapping[str, int]:
+        """
+        Get the current scores of all players.
+        
+        Returns:
+            Read-only view mapping player identifiers to their scores
+        """
+        return MappingProxyType(self._scores)
+    
+    @property
+    def ties(self) -> int:
+        """
+        Get the current number of ties.
+        
+        Returns:
+            Number of tie games
+        """
+        return self._ties
+    
+    @ties.setter
+    def ties(self, ties: int) -> None:
+        """
+        Set the number of ties.
+        
+        Args:
+            ties: The new number of tie games
+        """
+        self._ties = ties
+        self._changed()
+    
+    def set_score(self, player: str, score: int) -> None:
+        """
+        Set a player's score.
+        
+        Args:
+            player: The identifier of the player
+            score: The new score
+        """
+        if player in self._scores:
+            self._scores[player] = score
+            self._changed()
     
     def add_win(self, player: str) -> None:
         """
@@ -29,27 +80,59 @@ class Scoreboard:
         Args:
             player: The identifier of the player who won
         """
-        if player in self.scores:
-            self.scores[player] += 1
+        if player in self._scores:
+            self._scores[player] += 1
+            self._changed()
     
     def add_tie(self) -> None:
         """
         Add a tie to the scoreboard.
         """
-        self.ties += 1
+        self._ties += 1
+        self._changed()
     
     def reset(self) -> None:
         """
         Reset all scores to zero.
         """
-        for player in self.scores:
-            self.scores[player] = 0
-        self.ties = 0
+        for player in self._scores:
+            self._scores[player] = 0
+        self._ties = 0
+        self._changed()
+    
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get a copy of the current scores including ties.
+        
+        Returns:
+            Dictionary mapping player identifiers and "ties" to their counts
+        """
+        snapshot: Dict[str, int] = dict(self.scores)
+        snapshot['ties'] = self.ties
+        return snapshot
+    
+    def _changed(self) -> None:
+        """
+        Invalidate the rendered scores and publish the new ones to spectators.
+        """
+        self._display = None
+        self.broadcaster.publish('score', self.snapshot())
     
     def display_scores(self) -> str:
         """
         Display the current scores in a formatted string.
         
+        Returns:
+            Formatted string showing all scores
+        """
+        if self._display is None:
+            self._display = self._render_scores()
+        return self._display
+    
+    def _render_scores(self) -> str:
+        """
+        Format the current scores.
+        
         Returns:
             Formatted string showing all scores
         """
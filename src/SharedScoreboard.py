@@ -0,0 +1,215 @@
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+from multiprocessing.synchronize import Lock
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional
+from Broadcaster import Broadcaster
+from Scoreboard import Scoreboard
+
+# Every counter occupies one signed 64-bit slot in the shared block
+SLOT_FORMAT: Final = 'q'
+SLOT_SIZE: int = 8
+
+class SharedScoreboard(Scoreboard):
+    """
+    Scoreboard backed by a shared memory block so that every worker process
+    updates and reads the same counters.
+
+    The block has a fixed layout: one slot per player, in the order the players
+    were given, followed by a single slot for ties. Each slot is guarded by its
+    own lock (lock striping) so increments on different counters never contend.
+    Reads go straight through a memoryview of the block without copying it.
+    Since other processes change the counters too, the rendered scores are
+    cached along with the counter values they show, and compared against the
+    block rather than invalidated on local changes.
+
+    Create the scoreboard in the parent process before forking the workers so
+    that they inherit both the mapping and the locks. The locks are not part of
+    the block, so attaching to it by name also requires the creator's locks.
+
+    Attributes:
+        players (List[str]): Player identifiers in slot order
+        name (str): Name of the underlying shared memory block
+    """
+
+    def __init__(self, players: List[str], name: Optional[str] = None, create: bool = True,
+                 locks: Optional[List[Lock]] = None) -> None:
+        """
+        Create or attach to a shared scoreboard.
+
+        Args:
+            players: List of player identifiers
+            name: Optional name of the shared memory block
+            create: True to allocate a new zeroed block, False to attach to an
+                existing block called `name`
+            locks: Slot locks of the SharedScoreboard that created the block
+                (one per player plus one for ties), required when attaching
+
+        Raises:
+            ValueError: If attaching without `locks`, or if `locks` does not
+                provide one lock per slot
+        """
+        # Set first so that __del__ is safe even if initialization fails
+        self._closed: bool = True
+        self.players: List[str] = list(players)
+        self._slot_index: Dict[str, int] = {player: i for i, player in enumerate(self.players)}
+        self._tie_slot: int = len(self.players)
+        slot_count: int = len(self.players) + 1
+
+        if locks is None:
+            if not create:
+                raise ValueError('Attaching to an existing scoreboard requires its locks')
+            locks = [multiprocessing.Lock() for _ in range(slot_count)]
+        elif len(locks) != slot_count:
+            raise ValueError(f'Expected {slot_count} locks, got {len(locks)}')
+        self.locks: List[Lock] = locks
+        self.broadcaster: Broadcaster = Broadcaster()
+        self._display: Optional[str] = None
+        self._display_slots: array = array(SLOT_FORMAT)
+
+        self._shm: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            name=name, create=create, size=slot_count * SLOT_SIZE
+        )
+        self._slots: memoryview = self._shm.buf.cast(SLOT_FORMAT)
+        self._closed = False
+        if create:
+            for i in range(slot_count):
+                self._slots[i] = 0
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the shared memory block.
+
+        Returns:
+            Name other processes can use to attach to this scoreboard
+        """
+        return self._shm.name
+
+    @property
+    def scores(self) -> Mapping[str, int]:
+        """
+        Get the current scores of all players.
+
+        Returns:
+            Read-only view mapping player identifiers to their scores
+        """
+        return MappingProxyType({player: self._slots[i] for player, i in self._slot_index.items()})
+
+    @property
+    def ties(self) -> int:
+        """
+        Get the current number of ties.
+
+        Returns:
+            Number of tie games
+        """
+        return self._slots[self._tie_slot]
+
+    @ties.setter
+    def ties(self, ties: int) -> None:
+        """
+        Set the number of ties.
+
+        Args:
+            ties: The new number of tie games
+        """
+        self._set(self._tie_slot, ties)
+
+    def set_score(self, player: str, score: int) -> None:
+        """
+        Set a player's score.
+
+        Args:
+            player: The identifier of the player
+            score: The new score
+        """
+        if player in self._slot_index:
+            self._set(self._slot_index[player], score)
+
+    def _set(self, slot: int, value: int) -> None:
+        """
+        Atomically set a single counter slot.
+
+        Args:
+            slot: Index of the slot to set
+            value: The new counter value
+        """
+        with self.locks[slot]:
+            self._slots[slot] = value
+        self._changed()
+
+    def _increment(self, slot: int) -> None:
+        """
+        Atomically increment a single counter slot.
+
+        Args:
+            slot: Index of the slot to increment
+        """
+        with self.locks[slot]:
+            self._slots[slot] += 1
+        self._changed()
+
+    def add_win(self, player: str) -> None:
+        """
+        Add a win to a player's score.
+
+        Args:
+            player: The identifier of the player who won
+        """
+        if player in self._slot_index:
+            self._increment(self._slot_index[player])
+
+    def add_tie(self) -> None:
+        """
+        Add a tie to the scoreboard.
+        """
+        self._increment(self._tie_slot)
+
+    def reset(self) -> None:
+        """
+        Reset all scores to zero.
+        """
+        for i, lock in enumerate(self.locks):
+            with lock:
+                self._slots[i] = 0
+        self._changed()
+
+    def display_scores(self) -> str:
+        """
+        Display the current scores in a formatted string.
+
+        Returns:
+            Formatted string showing all scores
+        """
+        if self._display is None or self._slots != self._display_slots:
+            # Copy the counters before rendering so a concurrent change forces a new render
+            self._display_slots = array(SLOT_FORMAT, self._slots)
+            self._display = self._render_scores()
+        return self._display
+
+    def close(self) -> None:
+        """
+        Detach this process from the shared memory block.
+
+        Called automatically when the scoreboard is garbage collected.
+        """
+        if self._closed:
+            return
+        # The view must be released before the block can be closed
+        self._slots.release()
+        self._shm.close()
+        self._closed = True
+
+    def __del__(self) -> None:
+        """
+        Detach from the shared memory block when no longer referenced.
+        """
+        self.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory block. Call once, from the owning process.
+        """
+        self._shm.unlink()
@@ -1,3 +1,4 @@
+import sys
 from Game import Game
 from utils import clear_screen
 
@@ -9,9 +10,16 @@ def main() -> None:
     1. Clearing the screen
     2. Creating a new Game instance
     3. Starting the command loop
+    
+    An optional command-line argument names a directory to record the
+    session's rounds to.
     """
     clear_screen()
-    Game().cmdloop()
+    game: Game = Game(recording_dir=sys.argv[1] if len(sys.argv) > 1 else None)
+    try:
+        game.cmdloop()
+    finally:
+        game.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
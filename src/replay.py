@@ -0,0 +1,54 @@
+import sys
+from datetime import datetime
+from typing import List
+from Recording import RecordingReader
+
+USAGE: str = "Usage: python3 src/replay.py <recording_dir> [round]"
+
+def choice_name(choices: List[str], choice_id: int) -> str:
+    """
+    Get the name of a recorded choice.
+    
+    Args:
+        choices: Choice names stored with the recording
+        choice_id: ID of the choice
+        
+    Returns:
+        The choice name, or the ID if the recording does not name it
+    """
+    return choices[choice_id] if choice_id < len(choices) else f"#{choice_id}"
+
+def main() -> None:
+    """
+    Replay tool for recorded sessions.
+    
+    Usage: python3 src/replay.py <recording_dir> [round]
+    
+    Without a round, prints the number of recorded rounds and the final score.
+    With a round number (starting at 1), prints that round and the score
+    right after it.
+    """
+    if len(sys.argv) < 2 or (len(sys.argv) > 2 and not sys.argv[2].isdecimal()):
+        print(USAGE)
+        sys.exit(1)
+    
+    reader: RecordingReader = RecordingReader(sys.argv[1])
+    
+    if len(sys.argv) < 3:
+        print(f"Rounds: {len(reader)}")
+        print(reader.scoreboard_at(len(reader)).display_scores())
+        return
+    
+    number: int = int(sys.argv[2])
+    if not 1 <= number <= len(reader):
+        print(f"Round must be between 1 and {len(reader)}")
+        sys.exit(1)
+    
+    recorded = reader.round_at(number - 1)
+    played_at: str = datetime.fromtimestamp(recorded.timestamp).isoformat(sep=' ', timespec='seconds')
+    print(f"Round {number} ({played_at}): {choice_name(reader.choices, recorded.player_choice)} vs "
+          f"{choice_name(reader.choices, recorded.computer_choice)} -> {recorded.winner}")
+    print(reader.scoreboard_at(number).display_scores())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import threading
+import pytest
+from src.Broadcaster import Broadcaster
+from src.Scoreboard import Scoreboard
+
+def test_publish_coalesces_per_tick():
+    """Test that only the latest payload per topic is delivered on a tick"""
+    broadcaster = Broadcaster()
+    subscription = broadcaster.subscribe()
+    
+    broadcaster.publish('score', 1)
+    broadcaster.publish('score', 2)
+    broadcaster.publish('round', 'a')
+    assert subscription.get(timeout=0) is None
+    
+    assert broadcaster.tick() == 1
+    assert subscription.get(timeout=0) == {'score': 2, 'round': 'a'}
+    
+    assert broadcaster.tick() == 0
+    assert subscription.get(timeout=0) is None
+
+def test_unsubscribe():
+    """Test that unsubscribed spectators stop receiving updates"""
+    broadcaster = Broadcaster()
+    subscription = broadcaster.subscribe()
+    broadcaster.unsubscribe(subscription)
+    
+    broadcaster.publish('score', 1)
+    assert broadcaster.tick() == 0
+    assert broadcaster.subscriber_count == 0
+
+def test_slow_subscriber_dropped():
+    """Test that a subscriber with a full queue is dropped instead of blocking"""
+    broadcaster = Broadcaster(max_pending=2)
+    slow = broadcaster.subscribe()
+    fast = broadcaster.subscribe(max_pending=10)
+    
+    for i in range(3):
+        broadcaster.publish('score', i)
+        broadcaster.tick()
+    
+    assert slow.dropped
+    assert not fast.dropped
+    assert broadcaster.subscriber_count == 1
+    assert [fast.get(timeout=0) for _ in range(3)] == [{'score': 0}, {'score': 1}, {'score': 2}]
+
+def test_closed_subscription_does_not_block():
+    """Test that get returns at once after a subscription is dropped or unsubscribed"""
+    broadcaster = Broadcaster(max_pending=1)
+    slow = broadcaster.subscribe()
+    for i in range(2):
+        broadcaster.publish('score', i)
+        broadcaster.tick()
+    
+    assert slow.closed
+    assert slow.get() == {'score': 0}
+    assert slow.get() is None
+    
+    waiting = broadcaster.subscribe()
+    waiter = threading.Thread(target=waiting.get)
+    waiter.start()
+    broadcaster.unsubscribe(waiting)
+    waiter.join(timeout=1)
+    assert not waiter.is_alive()
+    assert waiting.get() is None
+
+def test_background_ticks():
+    """Test that a started broadcaster delivers updates on its own thread"""
+    broadcaster = Broadcaster()
+    subscription = broadcaster.subscribe()
+    broadcaster.start(interval=0.01)
+    
+    broadcaster.publish('score', 1)
+    assert subscription.get(timeout=1) == {'score': 1}
+    
+    broadcaster.stop()
+    broadcaster.publish('score', 2)
+    assert subscription.get(timeout=0.05) is None
+
+def test_invalid_max_pending():
+    """Test that subscriber queues must be bounded"""
+    with pytest.raises(ValueError):
+        Broadcaster(max_pending=0)
+    with pytest.raises(ValueError):
+        Broadcaster().subscribe(max_pending=0)
+
+def test_updates_are_read_only():
+    """Test that a subscriber cannot change the update other subscribers see"""
+    broadcaster = Broadcaster()
+    first = broadcaster.subscribe()
+    second = broadcaster.subscribe()
+    broadcaster.publish('score', {'player': 1})
+    broadcaster.tick()
+    
+    update = first.get(timeout=0)
+    with pytest.raises(TypeError):
+        update['score'] = None
+    with pytest.raises(TypeError):
+        update['score']['player'] = 5
+    assert second.get(timeout=0) == {'score': {'player': 1}}
+
+def test_scoreboard_publishes_scores():
+    """Test that scoreboard changes are published to spectators"""
+    scoreboard = Scoreboard(['player', 'computer'])
+    subscription = scoreboard.broadcaster.subscribe()
+    
+    scoreboard.add_win('player')
+    scoreboard.add_tie()
+    scoreboard.broadcaster.tick()
+    assert subscription.get(timeout=0) == {'score': {'player': 1, 'computer': 0, 'ties': 1}}
+    
+    scoreboard.reset()
+    scoreboard.broadcaster.tick()
+    assert subscription.get(timeout=0) == {'score': {'player': 0, 'computer': 0, 'ties': 0}}
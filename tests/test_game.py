@@ -1,5 +1,6 @@
 import pytest
 from src.Game import Game, schema_config
+from src.Recording import RecordingReader
 
 def test_game_init():
     """Test Game initialization"""
@@ -58,21 +59,21 @@ def test_determine_winner_logic():
     """Test the core winner determination logic"""
     game = Game()
     
-    game._determine_winner('Rock', 'Rock')
+    assert game._determine_winner('Rock', 'Rock') == 'tie'
     assert game.scoreboard.ties == 1
     assert game.scoreboard.scores['player'] == 0
     assert game.scoreboard.scores['computer'] == 0
     
     game.scoreboard.reset()
     
-    game._determine_winner('Rock', 'Scissors')
+    assert game._determine_winner('Rock', 'Scissors') == 'player'
     assert game.scoreboard.scores['player'] == 1
     assert game.scoreboard.scores['computer'] == 0
     assert game.scoreboard.ties == 0
     
     game.scoreboard.reset()
     
-    game._determine_winner('Scissors', 'Rock')
+    assert game._determine_winner('Scissors', 'Rock') == 'computer'
     assert game.scoreboard.scores['player'] == 0
     assert game.scoreboard.scores['computer'] == 1
     assert game.scoreboard.ties == 0
@@ -85,4 +86,28 @@ def test_rule_win_reasons():
         for win_entry in win_entries:
             for loser, reason in win_entry.items():
                 assert game.rules[winner].beats(loser)
-                assert game.rules[winner].win_reason(loser) == reason
\ No newline at end of file
+                assert game.rules[winner].win_reason(loser) == reason
+
+def test_resolve_cache():
+    """Test that outcomes are resolved once per pair of choices"""
+    game = Game()
+    
+    outcome = game.resolve('Rock', 'Scissors')
+    assert outcome.winner == 'player'
+    assert outcome.reason == 'Crushes Scissors'
+    assert outcome.message == "\nYou WON! because Rock Crushes Scissors"
+    
+    assert game.resolve('Scissors', 'Rock').message == "\nComputer WON! because Rock Crushes Scissors"
+    assert game.resolve('Spock', 'Spock') == ('tie', '', "\nIt's a tie!")
+    
+    assert game.resolve('Rock', 'Scissors') is outcome
+    assert game.resolve.cache_info().hits == 1
+
+def test_recording_written_on_close(tmp_path):
+    """Test that recorded rounds reach disk when the game is closed"""
+    game = Game(recording_dir=str(tmp_path))
+    for _ in range(10):
+        game.recorder.record(0, 2, 'player')
+    game.close()
+    
+    assert len(RecordingReader(str(tmp_path))) == 10
@@ -0,0 +1,100 @@
+import pytest
+import src.Recording as Recording
+from src.Recording import RecordingReader, RecordingWriter, OUTCOMES, RECORD, HEADER
+
+CHOICES = ['Rock', 'Paper', 'Scissors', 'Lizard', 'Spock']
+
+def _outcome(i):
+    return OUTCOMES[i % 3 if i % 7 else 0]
+
+def _write(directory, rounds, start=0, batch_size=64):
+    writer = RecordingWriter(str(directory), CHOICES, batch_size=batch_size)
+    for i in range(start, start + rounds):
+        writer.record(i % 5, (i + 1) % 5, _outcome(i), timestamp=1000.0 + i)
+    writer.close()
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(Recording, 'SEGMENT_ROUNDS', 100)
+    monkeypatch.setattr(Recording, 'CHECKPOINT_INTERVAL', 16)
+
+def test_record_and_read(tmp_path):
+    """Test rounds read back as they were recorded"""
+    _write(tmp_path, 10)
+    reader = RecordingReader(str(tmp_path))
+    
+    assert len(reader) == 10
+    assert reader.round_at(3) == (3, 3, 4, _outcome(3), 1003.0)
+    assert reader.choices == CHOICES
+    assert [recorded.position for recorded in reader.rounds(7)] == [7, 8, 9]
+    assert (tmp_path / '000000.seg').stat().st_size == HEADER.size + 10 * RECORD.size
+    
+    with pytest.raises(IndexError):
+        reader.round_at(10)
+
+def test_seek_across_segments(tmp_path, small_segments):
+    """Test random access and scoreboard rebuilds across segments and checkpoints"""
+    _write(tmp_path, 350)
+    reader = RecordingReader(str(tmp_path))
+    
+    assert reader.segment_count == 4
+    assert len(reader) == 350
+    for index in (0, 99, 100, 250, 349):
+        assert reader.round_at(index).winner == _outcome(index)
+    
+    for index in (0, 1, 16, 100, 117, 350):
+        expected = [sum(1 for i in range(index) if _outcome(i) == outcome) for outcome in OUTCOMES]
+        assert reader.counts_at(index) == expected
+    
+    scoreboard = reader.scoreboard_at(350)
+    assert scoreboard.ties == reader.counts_at(350)[0]
+    assert scoreboard.scores == {'player': reader.counts_at(350)[1], 'computer': reader.counts_at(350)[2]}
+
+def test_resume_recording(tmp_path, small_segments):
+    """Test reopening a recording continues it in a new segment and a new session"""
+    _write(tmp_path, 30)
+    _write(tmp_path, 30, start=30)
+    reader = RecordingReader(str(tmp_path))
+    
+    assert reader.segment_count == 2
+    assert len(reader) == 60
+    assert reader.round_at(45).position == 45
+    assert reader.counts_at(30) == [0, 0, 0]
+    assert reader.counts_at(29) == [sum(1 for i in range(29) if _outcome(i) == outcome) for outcome in OUTCOMES]
+    assert reader.counts_at(60) == [sum(1 for i in range(30, 60) if _outcome(i) == outcome) for outcome in OUTCOMES]
+
+def test_reset(tmp_path, small_segments):
+    """Test scoreboard rebuilds restart from zero after a reset"""
+    writer = RecordingWriter(str(tmp_path), CHOICES, batch_size=8)
+    resets = (0, 20, 50, 100, 130)
+    for i in range(130):
+        if i in resets:
+            writer.reset()
+        writer.record(0, 1, _outcome(i), timestamp=1000.0 + i)
+    writer.reset()
+    writer.close()
+    reader = RecordingReader(str(tmp_path))
+    
+    for index in range(131):
+        last_reset = max(reset for reset in resets if reset <= index)
+        expected = [sum(1 for i in range(last_reset, index) if _outcome(i) == outcome) for outcome in OUTCOMES]
+        assert reader.counts_at(index) == expected
+    assert reader.scoreboard_at(130).display_scores() == "Player: 0 pts | Computer: 0 pts | Ties: 0"
+
+def test_resume_with_different_choices(tmp_path):
+    """Test a recording cannot be continued with differently numbered choices"""
+    _write(tmp_path, 5)
+    with pytest.raises(ValueError):
+        RecordingWriter(str(tmp_path), list(reversed(CHOICES)))
+
+def test_invalid_outcome(tmp_path):
+    """Test recording an unknown outcome or out-of-range choice raises an error"""
+    writer = RecordingWriter(str(tmp_path), CHOICES)
+    with pytest.raises(ValueError):
+        writer.record(0, 1, 'nobody')
+    with pytest.raises(ValueError):
+        writer.record(256, 1, 'player')
+    with pytest.raises(ValueError):
+        writer.record(0, -1, 'computer')
+    writer.close()
+    assert len(RecordingReader(str(tmp_path))) == 0
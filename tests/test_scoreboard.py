@@ -64,4 +64,33 @@ def test_display_scores():
     assert "Computer: 1 pts" in score_display
     assert "Ties: 1" in score_display
     
-    assert str(scoreboard) == score_display
\ No newline at end of file
+    assert str(scoreboard) == score_display
+
+def test_display_scores_cache():
+    """Test the rendered scores are reused until a counter changes"""
+    scoreboard = Scoreboard(['player', 'computer'])
+    
+    score_display = scoreboard.display_scores()
+    assert scoreboard.display_scores() is score_display
+    
+    scoreboard.add_win('player')
+    assert scoreboard.display_scores() == "Player: 1 pts | Computer: 0 pts | Ties: 0"
+    
+    scoreboard.add_tie()
+    assert scoreboard.display_scores() == "Player: 1 pts | Computer: 0 pts | Ties: 1"
+    
+    scoreboard.reset()
+    assert scoreboard.display_scores() == "Player: 0 pts | Computer: 0 pts | Ties: 0"
+
+def test_set_counts():
+    """Test setting counts directly keeps the rendered scores current"""
+    scoreboard = Scoreboard(['player', 'computer'])
+    scoreboard.display_scores()
+    
+    scoreboard.set_score('player', 5)
+    scoreboard.set_score('nonexistent', 1)
+    scoreboard.ties = 3
+    assert scoreboard.display_scores() == "Player: 5 pts | Computer: 0 pts | Ties: 3"
+    
+    with pytest.raises(TypeError):
+        scoreboard.scores['player'] = 1
@@ -0,0 +1,94 @@
+import gc
+import multiprocessing
+import sys
+from multiprocessing import shared_memory
+import pytest
+from src.SharedScoreboard import SharedScoreboard
+
+@pytest.fixture
+def scoreboard():
+    scoreboard = SharedScoreboard(['player', 'computer'])
+    yield scoreboard
+    scoreboard.close()
+    scoreboard.unlink()
+
+def _play(scoreboard, rounds):
+    for _ in range(rounds):
+        scoreboard.add_win('player')
+        scoreboard.add_tie()
+
+def test_shared_scoreboard_semantics(scoreboard):
+    """Test SharedScoreboard behaves like Scoreboard"""
+    assert scoreboard.scores == {'player': 0, 'computer': 0}
+    assert scoreboard.ties == 0
+
+    scoreboard.add_win('player')
+    scoreboard.add_win('computer')
+    scoreboard.add_win('computer')
+    scoreboard.add_win('nonexistent')
+    scoreboard.add_tie()
+    assert scoreboard.scores == {'player': 1, 'computer': 2}
+    assert scoreboard.display_scores() == "Player: 1 pts | Computer: 2 pts | Ties: 1"
+
+    scoreboard.reset()
+    assert scoreboard.scores == {'player': 0, 'computer': 0}
+    assert scoreboard.ties == 0
+
+    scoreboard.set_score('computer', 4)
+    scoreboard.ties = 2
+    assert scoreboard.display_scores() == "Player: 0 pts | Computer: 4 pts | Ties: 2"
+
+    with pytest.raises(TypeError):
+        scoreboard.scores['player'] = 5
+
+def test_shared_scoreboard_attach(scoreboard):
+    """Test a second scoreboard attached by name sees the same counters"""
+    attached = SharedScoreboard(['player', 'computer'], name=scoreboard.name,
+                                create=False, locks=scoreboard.locks)
+    attached.add_win('computer')
+    attached.add_tie()
+    assert scoreboard.scores['computer'] == 1
+    assert scoreboard.ties == 1
+    assert scoreboard.display_scores() == "Player: 0 pts | Computer: 1 pts | Ties: 1"
+
+    attached.add_win('player')
+    assert scoreboard.display_scores() == "Player: 1 pts | Computer: 1 pts | Ties: 1"
+    attached.close()
+
+def test_shared_scoreboard_invalid_locks():
+    """Test SharedScoreboard rejects a lock list that does not match the layout"""
+    with pytest.raises(ValueError):
+        SharedScoreboard(['player', 'computer'], locks=[multiprocessing.Lock()])
+
+def test_shared_scoreboard_attach_requires_locks(scoreboard):
+    """Test attaching without the creator's locks is rejected"""
+    with pytest.raises(ValueError):
+        SharedScoreboard(['player', 'computer'], name=scoreboard.name, create=False)
+
+def test_shared_scoreboard_closes_on_collection(scoreboard, monkeypatch):
+    """Test scoreboards that are never closed detach cleanly when collected"""
+    unraisable = []
+    monkeypatch.setattr(sys, 'unraisablehook', unraisable.append)
+
+    created = SharedScoreboard(['player', 'computer'])
+    name = created.name
+    attached = SharedScoreboard(['player', 'computer'], name=scoreboard.name,
+                                create=False, locks=scoreboard.locks)
+    del created, attached
+    gc.collect()
+
+    assert unraisable == []
+    shared_memory.SharedMemory(name=name).unlink()
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='requires fork')
+def test_shared_scoreboard_across_processes(scoreboard):
+    """Test increments from several worker processes are all counted"""
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_play, args=(scoreboard, 500)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert scoreboard.scores == {'player': 2000, 'computer': 0}
+    assert scoreboard.ties == 2000